@@ -46,6 +46,8 @@ def row_epoch(row: dict) -> Optional[float]:
     ts = row.get(DET_TIMESTAMP_FIELD)
     if not ts:
         return None
+    if isinstance(ts, (int, float)):
+        return ts / 1000.0  # DB API stores epoch milliseconds
     try:
         return datetime.fromisoformat(str(ts).replace("Z", "+00:00")).timestamp()
     except Exception:
@@ -62,7 +62,7 @@ YAW_RATE_DAMPING_GAIN = float(get_env("GATE_YAW_RATE_DAMPING_GAIN", "0.1"))
 # Detection -> estimate
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class GateDetection:
     found: bool
     bbox_center_norm: Tuple[float, float] = (0.5, 0.5)
@@ -97,7 +97,7 @@ def fetch_gate_detection(client: AUVClient) -> GateDetection:
     )
 
 
-@dataclass
+@dataclass(slots=True)
 class GateEstimate:
     bearing_rad: float = 0.0
     elevation_rad: float = 0.0
@@ -72,7 +72,7 @@ YAW_RATE_DAMPING_GAIN = float(get_env("SLALOM_YAW_RATE_DAMPING_GAIN", "0.1"))
 # Detection -> row pair (with adaptive LM / MR selection)
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class RowDetection:
     found: bool
     side: Optional[str] = None     # "LM" or "MR" -- which gap this row used
@@ -163,7 +163,7 @@ def fetch_row_pair(client: AUVClient, locked_side: Optional[str] = None) -> RowD
     )
 
 
-@dataclass
+@dataclass(slots=True)
 class RowEstimate:
     bearing_rad: float = 0.0
     elevation_rad: float = 0.0
@@ -15,7 +15,7 @@ except ImportError:
     log.warning("ultralytics not installed; object detection disabled")
 
 
-@dataclass
+@dataclass(slots=True)
 class Detection:
     class_name: str
     confidence: float
@@ -1,13 +1,21 @@
 import os
+from functools import cache
 from pathlib import Path
 
 from dotenv import load_dotenv
 
+_ENV_PATH = Path(__file__).resolve().parent.parent / ".env"
 
+
+@cache
 def load_env() -> None:
-    """Load .env from the project root (two levels up from this file)."""
-    env_path = Path(__file__).resolve().parent.parent / ".env"
-    load_dotenv(dotenv_path=env_path, override=False)
+    """
+    Load .env from the project root (two levels up from this file).
+
+    Runs once per process: with override=False a second load could never
+    change a value already in os.environ, so repeat calls are free.
+    """
+    load_dotenv(dotenv_path=_ENV_PATH, override=False)
 
 
 def get_env(key: str, default: str | None = None, required: bool = False) -> str | None:
@@ -1,8 +1,27 @@
 import aiosqlite
 from typing import Any, List, Optional, Tuple
-from datetime import datetime
+from datetime import datetime, timezone
 import os
 
+# Connection-level tuning applied on every connect: WAL lets readers proceed
+# while a write is in flight, and NORMAL sync drops the per-commit fsync.
+_CONNECT_PRAGMAS = """
+    PRAGMA journal_mode = WAL;
+    PRAGMA synchronous = NORMAL;
+    PRAGMA temp_store = MEMORY;
+    PRAGMA cache_size = -64000;
+    PRAGMA mmap_size = 268435456;
+    PRAGMA foreign_keys = ON;
+    PRAGMA busy_timeout = 5000;
+"""
+
+
+def _epoch_ms(dt: datetime) -> int:
+    """Unix epoch milliseconds; naive datetimes are UTC, matching the API's start/end."""
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return int(dt.timestamp() * 1000)
+
 
 class DatabaseManager:
     def __init__(self, db_path: str):
@@ -11,8 +30,7 @@ class DatabaseManager:
 
     async def connect(self):
         self.connection = await aiosqlite.connect(self.db_path)
-        await self.connection.execute("PRAGMA foreign_keys = ON;")
-        await self.connection.commit()
+        await self.connection.executescript(_CONNECT_PRAGMAS)
 
     async def close(self):
         if self.connection:
@@ -43,10 +61,16 @@ class DatabaseManager:
     async def fetchlatest(self, table: str, timestamp_column: str) -> Optional[aiosqlite.Row]:
         query = f"SELECT * FROM {table} ORDER BY {timestamp_column} DESC LIMIT 1"
         return await self.fetchone(query)
+
+    async def fetchlatest_by_rowid(self, table: str) -> Optional[aiosqlite.Row]:
+        """Most recently inserted row, via a rightmost descent of the rowid B-tree."""
+        query = f"SELECT * FROM {table} ORDER BY ID DESC LIMIT 1"
+        return await self.fetchone(query)
     
     async def fetchbetween(self, table: str, timestamp_column: str, start: datetime, end: datetime) -> List[aiosqlite.Row]:
         query = f"SELECT * FROM {table} WHERE {timestamp_column} BETWEEN ? AND ?"
-        params = (start.isoformat(), end.isoformat())
+        # TIMESTAMP columns hold unix epoch milliseconds
+        params = (_epoch_ms(start), _epoch_ms(end))
         return await self.fetchall(query, params)
     
     async def setup(self):
@@ -55,7 +79,7 @@ class DatabaseManager:
             """
                 CREATE TABLE IF NOT EXISTS inputs (
                     ID INTEGER PRIMARY KEY AUTOINCREMENT,
-                    TIMESTAMP TEXT NOT NULL,
+                    TIMESTAMP INTEGER NOT NULL DEFAULT (CAST((julianday('now') - 2440587.5) * 86400000 AS INTEGER)),
                     SURGE REAL NOT NULL,
                     SWAY REAL NOT NULL,
                     HEAVE REAL NOT NULL,
@@ -72,7 +96,7 @@ class DatabaseManager:
             """
                 CREATE TABLE IF NOT EXISTS outputs (
                     ID INTEGER PRIMARY KEY AUTOINCREMENT,
-                    TIMESTAMP TEXT NOT NULL,
+                    TIMESTAMP INTEGER NOT NULL DEFAULT (CAST((julianday('now') - 2440587.5) * 86400000 AS INTEGER)),
                     MOTOR1 INTEGER NOT NULL,
                     MOTOR2 INTEGER NOT NULL,
                     MOTOR3 INTEGER NOT NULL,
@@ -87,7 +111,7 @@ class DatabaseManager:
             """
                 CREATE TABLE IF NOT EXISTS hydrophone (
                     ID INTEGER PRIMARY KEY AUTOINCREMENT,
-                    TIMESTAMP TEXT NOT NULL,
+                    TIMESTAMP INTEGER NOT NULL DEFAULT (CAST((julianday('now') - 2440587.5) * 86400000 AS INTEGER)),
                     HEADING STRING(5) NOT NULL
                 );
             """,
@@ -95,7 +119,7 @@ class DatabaseManager:
             """
                 CREATE TABLE IF NOT EXISTS depth (
                     ID INTEGER PRIMARY KEY AUTOINCREMENT,
-                    TIMESTAMP TEXT NOT NULL,
+                    TIMESTAMP INTEGER NOT NULL DEFAULT (CAST((julianday('now') - 2440587.5) * 86400000 AS INTEGER)),
                     DEPTH REAL NOT NULL
                 );
             """,
@@ -103,7 +127,7 @@ class DatabaseManager:
             """
                 CREATE TABLE IF NOT EXISTS imu (
                     ID INTEGER PRIMARY KEY AUTOINCREMENT,
-                    TIMESTAMP TEXT NOT NULL,
+                    TIMESTAMP INTEGER NOT NULL DEFAULT (CAST((julianday('now') - 2440587.5) * 86400000 AS INTEGER)),
                     ACCEL_X REAL NOT NULL,
                     ACCEL_Y REAL NOT NULL,
                     ACCEL_Z REAL NOT NULL,
@@ -119,7 +143,7 @@ class DatabaseManager:
             """
                 CREATE TABLE IF NOT EXISTS power_safety (
                     ID INTEGER PRIMARY KEY AUTOINCREMENT,
-                    TIMESTAMP TEXT NOT NULL,
+                    TIMESTAMP INTEGER NOT NULL DEFAULT (CAST((julianday('now') - 2440587.5) * 86400000 AS INTEGER)),
                     B1_VOLTAGE INTEGER NOT NULL,
                     B2_VOLTAGE INTEGER NOT NULL,
                     B3_VOLTAGE INTEGER NOT NULL,
@@ -130,7 +154,17 @@ class DatabaseManager:
                     B2_TEMP INTEGER NOT NULL,
                     B3_TEMP INTEGER NOT NULL
                 );
-            """
+            """,
+            # TIMESTAMP indexes for range filters
+            "CREATE INDEX IF NOT EXISTS idx_inputs_ts ON inputs(TIMESTAMP);",
+            "CREATE INDEX IF NOT EXISTS idx_outputs_ts ON outputs(TIMESTAMP);",
+            "CREATE INDEX IF NOT EXISTS idx_hydrophone_ts ON hydrophone(TIMESTAMP);",
+            "CREATE INDEX IF NOT EXISTS idx_depth_ts ON depth(TIMESTAMP);",
+            "CREATE INDEX IF NOT EXISTS idx_imu_ts ON imu(TIMESTAMP);",
+            "CREATE INDEX IF NOT EXISTS idx_power_safety_ts ON power_safety(TIMESTAMP);",
+            # Refresh planner statistics so the indexes are actually used
+            "PRAGMA analysis_limit = 400;",
+            "ANALYZE;",
         ]
         
         for query in queries:
@@ -1,30 +1,65 @@
+import asyncio
 from contextlib import asynccontextmanager
 from typing import AsyncIterator
 
 import aiosqlite
-from fastapi import FastAPI, Request
+from fastapi import FastAPI, HTTPException
 
 from database import DatabaseManager  # your existing file with DatabaseManager
 
+# Write-side handle: the shared connection plus the lock that serialises writes.
+# Reads stay lock-free and run concurrently under WAL.
+Writer = tuple[aiosqlite.Connection, asyncio.Lock]
+
+# Process-wide handles, bound once in lifespan so the per-request dependencies
+# below are a plain global load instead of a request.app.state attribute walk.
+_conn: aiosqlite.Connection | None = None
+_writer: Writer | None = None
+
+
+async def _check_timestamp_schema(conn: aiosqlite.Connection) -> None:
+    """
+    Refuse to serve a file created with the old TEXT timestamp schema:
+    CREATE TABLE IF NOT EXISTS won't migrate it, and the epoch-ms range
+    filters would silently compare numbers against ISO strings.
+    """
+    cur = await conn.execute(
+        "SELECT m.name FROM sqlite_master AS m, pragma_table_info(m.name) AS p "
+        "WHERE m.type = 'table' AND p.name = 'TIMESTAMP' AND upper(p.type) <> 'INTEGER';",
+    )
+    stale = [name for (name,) in await cur.fetchall()]
+    await cur.close()
+    if stale:
+        raise RuntimeError(
+            f"{', '.join(stale)} still use the old TEXT TIMESTAMP schema; "
+            "delete auv_database.db so it is recreated with INTEGER epoch-ms timestamps",
+        )
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     """
-    App startup/shutdown: create the DB connection, ensure tables exist,
-    enable foreign keys, and make rows accessible by column name.
+    App startup/shutdown: create the DB connection (WAL + connection PRAGMAs
+    are applied by DatabaseManager.connect), ensure tables exist, and make
+    rows accessible by column name.
     """
     dbm = DatabaseManager("auv_database.db")
     await dbm.connect()
+    try:
+        await _check_timestamp_schema(dbm.connection)
+    except RuntimeError:
+        await dbm.close()
+        raise
 
     # Name-based access for rows (row["COL"])
     dbm.connection.row_factory = aiosqlite.Row
 
-    # Ensure tables exist and set DB-side default timestamps in UTC
+    # Ensure tables exist and set DB-side default timestamps (unix epoch ms, UTC)
     await dbm.connection.executescript(
         """
         CREATE TABLE IF NOT EXISTS inputs (
             ID INTEGER PRIMARY KEY AUTOINCREMENT,
-            TIMESTAMP TEXT NOT NULL DEFAULT (strftime('%Y-%m-%dT%H:%M:%fZ','now')),
+            TIMESTAMP INTEGER NOT NULL DEFAULT (CAST((julianday('now') - 2440587.5) * 86400000 AS INTEGER)),
             SURGE INTEGER NOT NULL,
             SWAY INTEGER NOT NULL,
             HEAVE INTEGER NOT NULL,
@@ -39,7 +74,7 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
 
         CREATE TABLE IF NOT EXISTS outputs (
             ID INTEGER PRIMARY KEY AUTOINCREMENT,
-            TIMESTAMP TEXT NOT NULL DEFAULT (strftime('%Y-%m-%dT%H:%M:%fZ','now')),
+            TIMESTAMP INTEGER NOT NULL DEFAULT (CAST((julianday('now') - 2440587.5) * 86400000 AS INTEGER)),
             MOTOR1 INTEGER NOT NULL,
             MOTOR2 INTEGER NOT NULL,
             MOTOR3 INTEGER NOT NULL,
@@ -55,19 +90,19 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
 
         CREATE TABLE IF NOT EXISTS hydrophone (
             ID INTEGER PRIMARY KEY AUTOINCREMENT,
-            TIMESTAMP TEXT NOT NULL DEFAULT (strftime('%Y-%m-%dT%H:%M:%fZ','now')),
+            TIMESTAMP INTEGER NOT NULL DEFAULT (CAST((julianday('now') - 2440587.5) * 86400000 AS INTEGER)),
             HEADING STRING(5) NOT NULL
         );
 
         CREATE TABLE IF NOT EXISTS depth (
             ID INTEGER PRIMARY KEY AUTOINCREMENT,
-            TIMESTAMP TEXT NOT NULL DEFAULT (strftime('%Y-%m-%dT%H:%M:%fZ','now')),
+            TIMESTAMP INTEGER NOT NULL DEFAULT (CAST((julianday('now') - 2440587.5) * 86400000 AS INTEGER)),
             DEPTH REAL NOT NULL
         );
 
         CREATE TABLE IF NOT EXISTS imu (
             ID INTEGER PRIMARY KEY AUTOINCREMENT,
-            TIMESTAMP TEXT NOT NULL DEFAULT (strftime('%Y-%m-%dT%H:%M:%fZ','now')),
+            TIMESTAMP INTEGER NOT NULL DEFAULT (CAST((julianday('now') - 2440587.5) * 86400000 AS INTEGER)),
             ACCEL_X REAL NOT NULL,
             ACCEL_Y REAL NOT NULL,
             ACCEL_Z REAL NOT NULL,
@@ -81,7 +116,7 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
 
         CREATE TABLE IF NOT EXISTS power_safety (
             ID INTEGER PRIMARY KEY AUTOINCREMENT,
-            TIMESTAMP TEXT NOT NULL DEFAULT (strftime('%Y-%m-%dT%H:%M:%fZ','now')),
+            TIMESTAMP INTEGER NOT NULL DEFAULT (CAST((julianday('now') - 2440587.5) * 86400000 AS INTEGER)),
             B1_VOLTAGE INTEGER NOT NULL,
             B2_VOLTAGE INTEGER NOT NULL,
             B3_VOLTAGE INTEGER NOT NULL,
@@ -92,18 +127,47 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
             B2_TEMP INTEGER NOT NULL,
             B3_TEMP INTEGER NOT NULL
         );
+
+        -- Range filters in _list_by_time seek these instead of scanning
+        CREATE INDEX IF NOT EXISTS idx_inputs_ts ON inputs(TIMESTAMP);
+        CREATE INDEX IF NOT EXISTS idx_outputs_ts ON outputs(TIMESTAMP);
+        CREATE INDEX IF NOT EXISTS idx_hydrophone_ts ON hydrophone(TIMESTAMP);
+        CREATE INDEX IF NOT EXISTS idx_depth_ts ON depth(TIMESTAMP);
+        CREATE INDEX IF NOT EXISTS idx_imu_ts ON imu(TIMESTAMP);
+        CREATE INDEX IF NOT EXISTS idx_power_safety_ts ON power_safety(TIMESTAMP);
+
+        -- Populate sqlite_stat1 so the planner picks the indexes up
+        PRAGMA analysis_limit = 400;
+        ANALYZE;
         """
     )
     await dbm.connection.commit()
 
-    # stash the manager on app.state so handlers can access the connection
+    # stash the manager on app.state so handlers can access the connection;
+    # the write lock keeps exactly one INSERT/DELETE + commit in flight
+    global _conn, _writer
     app.state.dbm = dbm
+    app.state.write_lock = asyncio.Lock()
+    _conn = dbm.connection
+    _writer = (_conn, app.state.write_lock)
     try:
         yield
     finally:
+        _conn = _writer = None
         await app.state.dbm.close()
 
 
-# Dependency: fetch the active aiosqlite connection for each request
-async def get_db(request: Request) -> aiosqlite.Connection:
-    return request.app.state.dbm.connection
+# Dependency: fetch the active aiosqlite connection for each request.
+# Kept async (sync dependencies are run in the threadpool) and still injected
+# via Depends so tests can override it. Outside the lifespan (before startup
+# or after shutdown) there is no connection yet, so both answer 503.
+async def get_db() -> aiosqlite.Connection:
+    if _conn is None:
+        raise HTTPException(503, "database not ready")
+    return _conn
+
+
+async def get_write() -> Writer:
+    if _writer is None:
+        raise HTTPException(503, "database not ready")
+    return _writer
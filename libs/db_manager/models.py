@@ -1,11 +1,55 @@
-from typing import Optional
+import inspect
+from collections.abc import Callable
+from typing import Any, ClassVar, Optional
 
-from pydantic import BaseModel, Field, confloat, conint, constr
+from fastapi import Form
+from fastapi.exceptions import RequestValidationError
+from pydantic import BaseModel, Field, ValidationError, confloat, conint, constr
+
+
+# ---- form parsing (shared) ----
+class FormModel(BaseModel):
+    """
+    Base for the *Create models: each subclass gets an ``as_form`` dependency
+    whose signature is one Form field per model field, so a handler can take
+    ``row: XCreate = Depends(XCreate.as_form)`` and get a validated model.
+
+    The Form params are typed Any so FastAPI only collects the raw strings;
+    the model is the single place each field is parsed and validated.
+    """
+
+    as_form: ClassVar[Callable[..., "FormModel"]]
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        super().__pydantic_init_subclass__(**kwargs)
+        params = [
+            inspect.Parameter(
+                name,
+                inspect.Parameter.KEYWORD_ONLY,
+                default=Form(... if f.is_required() else f.default),
+                annotation=Any,
+            )
+            for name, f in cls.model_fields.items()
+        ]
+
+        def as_form(**data: Any) -> "FormModel":
+            try:
+                # Lax: form values always arrive as strings, even for strict fields
+                return cls.model_validate(data, strict=False)
+            except ValidationError as e:
+                # Same 422 shape as FastAPI's own form errors: loc = ["body", field]
+                raise RequestValidationError(
+                    [{**err, "loc": ("body", *err["loc"])} for err in e.errors()]
+                ) from None
+
+        as_form.__signature__ = inspect.Signature(params)  # type: ignore[attr-defined]
+        cls.as_form = staticmethod(as_form)
 
 
 # ---- inputs ----
-class InputsCreate(BaseModel):
-    TIMESTAMP: Optional[str] = Field(None, description="ISO8601 UTC string")
+class InputsCreate(FormModel):
+    TIMESTAMP: Optional[int] = Field(None, description="Unix epoch milliseconds (UTC)")
     SURGE: float; SWAY: float; HEAVE: float; ROLL: float; PITCH: float; YAW: float
     S1: conint(ge=0, le=1); S2: conint(ge=0, le=1)
     S3: int
@@ -13,58 +57,58 @@ class InputsCreate(BaseModel):
 
 class InputsRead(InputsCreate):
     ID: int
-    TIMESTAMP: str
+    TIMESTAMP: int
 
 # ---- outputs ----
-class OutputsCreate(BaseModel):
-    TIMESTAMP: Optional[str] = None
+class OutputsCreate(FormModel):
+    TIMESTAMP: Optional[int] = None
     MOTOR1: int; MOTOR2: int; MOTOR3: int; MOTOR4: int
     MOTOR5: int; MOTOR6: int; MOTOR7: int; MOTOR8: int
     S1: int; S2: int; S3: int
 
 class OutputsRead(OutputsCreate):
     ID: int
-    TIMESTAMP: str
+    TIMESTAMP: int
 
 # ---- hydrophone ----
-class HydrophoneCreate(BaseModel):
-    TIMESTAMP: Optional[str] = None
+class HydrophoneCreate(FormModel):
+    TIMESTAMP: Optional[int] = None
     HEADING: constr(strip_whitespace=True, min_length=1, max_length=5)
 
 class HydrophoneRead(HydrophoneCreate):
     ID: int
-    TIMESTAMP: str
+    TIMESTAMP: int
 
 # ---- depth ----
-class DepthCreate(BaseModel):
-    TIMESTAMP: Optional[str] = None
+class DepthCreate(FormModel):
+    TIMESTAMP: Optional[int] = None
     DEPTH: confloat(strict=True)
 
 class DepthRead(DepthCreate):
     ID: int
-    TIMESTAMP: str
+    TIMESTAMP: int
 
 # ---- imu ----
-class ImuCreate(BaseModel):
-    TIMESTAMP: Optional[str] = None
+class ImuCreate(FormModel):
+    TIMESTAMP: Optional[int] = None
     ACCEL_X: float; ACCEL_Y: float; ACCEL_Z: float
     GYRO_X: float;  GYRO_Y: float;  GYRO_Z: float
     MAG_X: float;   MAG_Y: float;   MAG_Z: float
 
 class ImuRead(ImuCreate):
     ID: int
-    TIMESTAMP: str
+    TIMESTAMP: int
 
 # ---- power_safety ----
-class PowerSafetyCreate(BaseModel):
-    TIMESTAMP: Optional[str] = None
+class PowerSafetyCreate(FormModel):
+    TIMESTAMP: Optional[int] = None
     B1_VOLTAGE: int; B2_VOLTAGE: int; B3_VOLTAGE: int
     B1_CURRENT: int; B2_CURRENT: int; B3_CURRENT: int
     B1_TEMP: int;    B2_TEMP: int;    B3_TEMP: int
 
 class PowerSafetyRead(PowerSafetyCreate):
     ID: int
-    TIMESTAMP: str
+    TIMESTAMP: int
 
 # ---- list wrapper (shared) ----
 class ListEnvelope(BaseModel):
@@ -72,3 +116,35 @@ class ListEnvelope(BaseModel):
     total: int
     limit: int
     offset: int
+
+# Same page, column names sent once: rows[i][j] is the value of columns[j]
+class ColumnarEnvelope(BaseModel):
+    columns: list[str]
+    rows: list[list]
+    total: int
+    limit: int
+    offset: int
+
+
+# ---- column lists (shared) ----
+# Explicit per-table projections used by the routers instead of SELECT *.
+COLUMNS: dict[str, tuple[str, ...]] = {
+    "inputs": (
+        "ID", "TIMESTAMP", "SURGE", "SWAY", "HEAVE", "ROLL", "PITCH", "YAW",
+        "S1", "S2", "S3", "ARM",
+    ),
+    "outputs": (
+        "ID", "TIMESTAMP", "MOTOR1", "MOTOR2", "MOTOR3", "MOTOR4",
+        "MOTOR5", "MOTOR6", "MOTOR7", "MOTOR8", "S1", "S2", "S3",
+    ),
+    "hydrophone": ("ID", "TIMESTAMP", "HEADING"),
+    "depth": ("ID", "TIMESTAMP", "DEPTH"),
+    "imu": (
+        "ID", "TIMESTAMP", "ACCEL_X", "ACCEL_Y", "ACCEL_Z",
+        "GYRO_X", "GYRO_Y", "GYRO_Z", "MAG_X", "MAG_Y", "MAG_Z",
+    ),
+    "power_safety": (
+        "ID", "TIMESTAMP", "B1_VOLTAGE", "B2_VOLTAGE", "B3_VOLTAGE",
+        "B1_CURRENT", "B2_CURRENT", "B3_CURRENT", "B1_TEMP", "B2_TEMP", "B3_TEMP",
+    ),
+}
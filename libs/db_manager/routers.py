@@ -1,70 +1,259 @@
-from typing import Optional, Sequence
+from collections.abc import Sequence
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Any, Literal, Optional
 
 import aiosqlite
-from fastapi import APIRouter, Depends, HTTPException, Query, Form
+from fastapi import APIRouter, Body, Depends, HTTPException, Query
+from pydantic import BaseModel
 
-from deps import get_db
+from deps import Writer, get_db, get_write
+from models import (
+    COLUMNS, DepthCreate, HydrophoneCreate, ImuCreate, InputsCreate, OutputsCreate,
+    PowerSafetyCreate,
+)
 
 router = APIRouter()
 
+# Same expression as the TIMESTAMP column default (unix epoch ms, UTC)
+_NOW_MS = "CAST((julianday('now') - 2440587.5) * 86400000 AS INTEGER)"
+
+# One list page: dicts for format=rows, bare value tuples for format=columnar
+Rows = list[dict[str, Any]] | list[tuple[Any, ...]]
+
+# Rows per bulk POST: a batch holds the write lock for its whole executemany
+_BULK_MAX = 1000
+
+
+# ----------------------------------------------------------------------
+# SQL builders
+#   Memoised so each statement is formatted once and every call passes the
+#   same string, which keeps sqlite3's prepared-statement cache warm.
+# ----------------------------------------------------------------------
+@lru_cache(maxsize=128)
+def _projection(table: str) -> str:
+    # Named columns rather than SELECT * so only the schema we expose is decoded
+    return ",".join(COLUMNS[table])
+
+@lru_cache(maxsize=128)
+def _insert_sql(table: str, cols: tuple[str, ...]) -> str:
+    placeholders = ",".join("?" * len(cols))
+    # RETURNING hands back the row we just wrote (SQLite >= 3.35), so there is
+    # no second SELECT that could pick up a concurrent insert instead.
+    return (
+        f"INSERT INTO {table} ({','.join(cols)}) VALUES ({placeholders}) "
+        f"RETURNING {_projection(table)};"
+    )
+
+@lru_cache(maxsize=128)
+def _insert_many_sql(table: str, cols: tuple[str, ...]) -> str:
+    # executemany needs one column list for every row, so a row that leaves
+    # TIMESTAMP unset falls back to the column default instead of NULL
+    placeholders = ",".join(f"COALESCE(?,{_NOW_MS})" if c == "TIMESTAMP" else "?" for c in cols)
+    return f"INSERT INTO {table} ({','.join(cols)}) VALUES ({placeholders});"
+
+@lru_cache(maxsize=128)
+def _select_by_id_sql(table: str) -> str:
+    return f"SELECT {_projection(table)} FROM {table} WHERE ID = ?;"
+
+@lru_cache(maxsize=128)
+def _delete_by_id_sql(table: str) -> str:
+    return f"DELETE FROM {table} WHERE ID = ?;"
+
+@lru_cache(maxsize=128)
+def _purge_sql(table: str, ts_col: str) -> str:
+    return f"DELETE FROM {table} WHERE {ts_col} < ?;"
+
+@lru_cache(maxsize=128)
+def _time_filter(ts_col: str, has_start: bool, has_end: bool) -> str:
+    if has_start and has_end:
+        return f" WHERE {ts_col} BETWEEN ? AND ?"
+    if has_start:
+        return f" WHERE {ts_col} >= ?"
+    if has_end:
+        return f" WHERE {ts_col} <= ?"
+    return ""
+
+@lru_cache(maxsize=128)
+def _list_sql(table: str, ts_col: str, has_start: bool, has_end: bool) -> str:
+    # COUNT(*) OVER() carries the unpaged total on every row, so the page and
+    # the count come back from one scan instead of two queries.
+    return (
+        f"SELECT {_projection(table)}, COUNT(*) OVER() AS _total FROM {table}"
+        f"{_time_filter(ts_col, has_start, has_end)} ORDER BY {ts_col} DESC LIMIT ? OFFSET ?;"
+    )
+
+@lru_cache(maxsize=128)
+def _count_sql(table: str, ts_col: str, has_start: bool, has_end: bool) -> str:
+    return f"SELECT COUNT(*) FROM {table}{_time_filter(ts_col, has_start, has_end)};"
+
+@lru_cache(maxsize=128)
+def _latest_sql(table: str) -> str:
+    # ID is the rowid, so the newest row is the rightmost leaf of the primary
+    # B-tree: one descent, no index lookup back into the table, and it is the
+    # last row written even when a caller supplied an older TIMESTAMP.
+    return f"SELECT {_projection(table)} FROM {table} ORDER BY ID DESC LIMIT 1;"
+
 
 # ----------------------------------------------------------------------
 # Helpers
 # ----------------------------------------------------------------------
+# Every write helper rolls back on failure while still holding the lock, so a
+# half-applied statement is never left pending on the shared connection for
+# the next writer's commit to pick up. Inserts report constraint violations
+# (e.g. a NaN, which SQLite stores as NULL in a NOT NULL column) as 422.
 async def _insert_and_fetch(
-    db: aiosqlite.Connection, table: str, cols: Sequence[str], values: Sequence
+    writer: Writer, table: str, cols: Sequence[str], values: Sequence
 ) -> dict:
-    placeholders = ",".join(["?"] * len(cols))
-    await db.execute(
-        f"INSERT INTO {table} ({','.join(cols)}) VALUES ({placeholders});",
-        values,
-    )
-    await db.commit()
-    cur = await db.execute(f"SELECT * FROM {table} ORDER BY ID DESC LIMIT 1;")
-    row = await cur.fetchone()
-    await cur.close()
+    db, lock = writer
+    async with lock:
+        try:
+            cur = await db.execute(_insert_sql(table, tuple(cols)), values)
+            row = await cur.fetchone()
+            await cur.close()
+            await db.commit()
+        except aiosqlite.IntegrityError as e:
+            await db.rollback()
+            raise HTTPException(422, f"{table} row rejected: {e}") from None
+        except Exception:
+            await db.rollback()
+            raise
+    assert row is not None  # INSERT ... RETURNING always yields the new row
     return dict(row)
 
+async def _insert_many(
+    writer: Writer, table: str, model: type[BaseModel], rows: Sequence[BaseModel]
+) -> dict:
+    """Insert every row with one executemany inside a single transaction (one commit)."""
+    db, lock = writer
+    cols = tuple(model.model_fields)
+    values = [tuple(getattr(r, c) for c in cols) for r in rows]
+    async with lock:
+        try:
+            await db.executemany(_insert_many_sql(table, cols), values)
+            await db.commit()
+        except aiosqlite.IntegrityError as e:
+            await db.rollback()
+            raise HTTPException(422, f"{table} batch rejected: {e}") from None
+        except Exception:
+            await db.rollback()
+            raise
+    return {"inserted": len(values)}
+
 async def _get_by_id(db: aiosqlite.Connection, table: str, id_: int) -> dict | None:
-    cur = await db.execute(f"SELECT * FROM {table} WHERE ID = ?;", (id_,))
+    cur = await db.execute(_select_by_id_sql(table), (id_,))
+    row = await cur.fetchone()
+    await cur.close()
+    return dict(row) if row else None
+
+async def _delete_by_id(writer: Writer, table: str, id_: int) -> int:
+    db, lock = writer
+    async with lock:
+        try:
+            cur = await db.execute(_delete_by_id_sql(table), (id_,))
+            await db.commit()
+        except Exception:
+            await db.rollback()
+            raise
+    return int(cur.rowcount)
+
+async def _purge_before(writer: Writer, table: str, ts_col: str, before_ms: int) -> int:
+    """Range-delete every row older than *before_ms* in one statement and one commit."""
+    db, lock = writer
+    async with lock:
+        try:
+            cur = await db.execute(_purge_sql(table, ts_col), (before_ms,))
+            await db.commit()
+        except Exception:
+            await db.rollback()
+            raise
+    return int(cur.rowcount)
+
+async def _latest(db: aiosqlite.Connection, table: str) -> dict | None:
+    cur = await db.execute(_latest_sql(table))
     row = await cur.fetchone()
     await cur.close()
     return dict(row) if row else None
 
-async def _delete_by_id(db: aiosqlite.Connection, table: str, id_: int) -> int:
-    cur = await db.execute(f"DELETE FROM {table} WHERE ID = ?;", (id_,))
-    await db.commit()
-    return cur.rowcount
+def _to_epoch_ms(value: str) -> int:
+    """Accept either epoch milliseconds or an ISO-8601 string (naive = UTC)."""
+    value = value.strip()
+    digits = value.removeprefix("-")
+    # ASCII only: str.isdigit() also accepts "²" (int() rejects it) and "١٢" (int() reads it)
+    if digits.isascii() and digits.isdigit():
+        return int(value)
+    try:
+        dt = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        raise HTTPException(422, f"invalid timestamp: {value!r}") from None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return int(dt.timestamp() * 1000)
 
 async def _list_by_time(
     db: aiosqlite.Connection, table: str, ts_col: str,
-    limit: int, offset: int, start: Optional[str], end: Optional[str]
-) -> tuple[list[dict], int]:
-    args: list = []
-    if start and end:
-        where = f" WHERE {ts_col} BETWEEN ? AND ?"
-        args = [start, end]
-    elif start:
-        where = f" WHERE {ts_col} >= ?"
-        args = [start]
-    elif end:
-        where = f" WHERE {ts_col} <= ?"
-        args = [end]
-    else:
-        where = ""
+    limit: int, offset: int, start: Optional[str], end: Optional[str],
+    columnar: bool = False,
+) -> tuple[Rows, int]:
+    start_ms = _to_epoch_ms(start) if start else None
+    end_ms = _to_epoch_ms(end) if end else None
 
-    cur = await db.execute(f"SELECT COUNT(*) FROM {table}{where};", args)
-    (total,) = await cur.fetchone()
-    await cur.close()
+    has_start, has_end = start_ms is not None, end_ms is not None
+    args = [v for v in (start_ms, end_ms) if v is not None]
 
     cur = await db.execute(
-        f"SELECT * FROM {table}{where} ORDER BY {ts_col} DESC LIMIT ? OFFSET ?;",
-        [*args, limit, offset],
+        _list_sql(table, ts_col, has_start, has_end), [*args, limit, offset]
     )
-    rows = [dict(r) for r in await cur.fetchall()]
+    raw = list(await cur.fetchall())
     await cur.close()
+
+    rows: Rows
+    if columnar:
+        # Bare value arrays; the column names are sent once in the envelope
+        rows = [r[:-1] for r in raw]
+    else:
+        # Zip against the known projection instead of dict(Row), which re-walks
+        # the cursor description for every row; the trailing _total is sliced off.
+        cols = COLUMNS[table]
+        rows = [dict(zip(cols, r[:-1], strict=True)) for r in raw]
+
+    total = 0
+    if raw:
+        total = int(raw[0][-1])
+    elif offset:
+        # Paged past the end: no row to carry the total, so count explicitly
+        cur = await db.execute(_count_sql(table, ts_col, has_start, has_end), args)
+        count = await cur.fetchone()
+        await cur.close()
+        if count is not None:
+            total = int(count[0])
     return rows, total
 
+def _page(table: str, rows: Rows, total: int, limit: int, offset: int, fmt: str) -> dict:
+    """Wrap a page as ListEnvelope (fmt="rows") or ColumnarEnvelope (fmt="columnar")."""
+    if fmt == "columnar":
+        return {"columns": COLUMNS[table], "rows": rows, "total": total, "limit": limit, "offset": offset}
+    return {"items": rows, "total": total, "limit": limit, "offset": offset}
+
+
+# ----------------------------------------------------------------------
+# purge (high-rate telemetry only)
+#   NOTE: registered before the per-table /{id} routes so /imu/purge is not
+#   parsed as an ID.
+# ----------------------------------------------------------------------
+_PURGEABLE = frozenset({"imu", "outputs", "power_safety"})
+
+@router.delete("/{table}/purge", tags=["purge"])
+async def purge_before(
+    table: str,
+    before: str = Query(..., description="Delete rows older than this (epoch ms or ISO-8601)"),
+    writer: Writer = Depends(get_write),
+):
+    if table not in _PURGEABLE:
+        raise HTTPException(404, f"{table} cannot be purged")
+    deleted = await _purge_before(writer, table, "TIMESTAMP", _to_epoch_ms(before))
+    return {"deleted": deleted}
+
 
 # ----------------------------------------------------------------------
 # inputs
@@ -72,14 +261,11 @@ async def _list_by_time(
 # ----------------------------------------------------------------------
 @router.post("/inputs", tags=["inputs"])
 async def create_inputs(
-    SURGE: float = Form(...), SWAY: float = Form(...), HEAVE: float = Form(...),
-    ROLL: float = Form(...), PITCH: float = Form(...), YAW: float = Form(...),
-    S1: int = Form(...), S2: int = Form(...), S3: int = Form(...), ARM: int = Form(...),
-    db: aiosqlite.Connection = Depends(get_db),
+    row: InputsCreate = Depends(InputsCreate.as_form),
+    writer: Writer = Depends(get_write),
 ):
-    cols = ["SURGE", "SWAY", "HEAVE", "ROLL", "PITCH", "YAW", "S1", "S2", "S3", "ARM"]
-    vals = [SURGE, SWAY, HEAVE, ROLL, PITCH, YAW, S1, S2, S3, ARM]
-    return await _insert_and_fetch(db, "inputs", cols, vals)
+    data = row.model_dump(exclude_none=True)
+    return await _insert_and_fetch(writer, "inputs", tuple(data), tuple(data.values()))
 
 @router.get("/inputs", tags=["inputs"])
 async def list_inputs(
@@ -87,17 +273,17 @@ async def list_inputs(
     offset: int = Query(0, ge=0),
     start: Optional[str] = None,
     end: Optional[str] = None,
+    fmt: Literal["rows", "columnar"] = Query("rows", alias="format"),
     db: aiosqlite.Connection = Depends(get_db),
 ):
-    rows, total = await _list_by_time(db, "inputs", "TIMESTAMP", limit, offset, start, end)
-    return {"items": rows, "total": total, "limit": limit, "offset": offset}
+    rows, total = await _list_by_time(
+        db, "inputs", "TIMESTAMP", limit, offset, start, end, fmt == "columnar"
+    )
+    return _page("inputs", rows, total, limit, offset, fmt)
 
 @router.get("/inputs/latest", tags=["inputs"])
 async def latest_inputs(db: aiosqlite.Connection = Depends(get_db)):
-    cur = await db.execute("SELECT * FROM inputs ORDER BY TIMESTAMP DESC LIMIT 1;")
-    row = await cur.fetchone()
-    await cur.close()
-    return dict(row) if row else None
+    return await _latest(db, "inputs")
 
 @router.get("/inputs/{id}", tags=["inputs"])
 async def get_inputs(id: int, db: aiosqlite.Connection = Depends(get_db)):
@@ -107,8 +293,8 @@ async def get_inputs(id: int, db: aiosqlite.Connection = Depends(get_db)):
     return row
 
 @router.delete("/inputs/{id}", status_code=204, tags=["inputs"])
-async def delete_inputs(id: int, db: aiosqlite.Connection = Depends(get_db)):
-    if await _delete_by_id(db, "inputs", id) == 0:
+async def delete_inputs(id: int, writer: Writer = Depends(get_write)):
+    if await _delete_by_id(writer, "inputs", id) == 0:
         raise HTTPException(404, "inputs not found")
 
 
@@ -117,14 +303,18 @@ async def delete_inputs(id: int, db: aiosqlite.Connection = Depends(get_db)):
 # ----------------------------------------------------------------------
 @router.post("/outputs", tags=["outputs"])
 async def create_outputs(
-    MOTOR1: int = Form(...), MOTOR2: int = Form(...), MOTOR3: int = Form(...), MOTOR4: int = Form(...),
-    MOTOR5: int = Form(...), MOTOR6: int = Form(...), MOTOR7: int = Form(...), MOTOR8: int = Form(...),
-    S1: int = Form(...), S2: int = Form(...), S3: int = Form(...),
-    db: aiosqlite.Connection = Depends(get_db),
+    row: OutputsCreate = Depends(OutputsCreate.as_form),
+    writer: Writer = Depends(get_write),
 ):
-    cols = ["MOTOR1", "MOTOR2", "MOTOR3", "MOTOR4", "MOTOR5", "MOTOR6", "MOTOR7", "MOTOR8", "S1", "S2", "S3"]
-    vals = [MOTOR1, MOTOR2, MOTOR3, MOTOR4, MOTOR5, MOTOR6, MOTOR7, MOTOR8, S1, S2, S3]
-    return await _insert_and_fetch(db, "outputs", cols, vals)
+    data = row.model_dump(exclude_none=True)
+    return await _insert_and_fetch(writer, "outputs", tuple(data), tuple(data.values()))
+
+@router.post("/outputs/bulk", tags=["outputs"])
+async def create_outputs_bulk(
+    rows: list[OutputsCreate] = Body(..., max_length=_BULK_MAX),
+    writer: Writer = Depends(get_write),
+):
+    return await _insert_many(writer, "outputs", OutputsCreate, rows)
 
 @router.get("/outputs", tags=["outputs"])
 async def list_outputs(
@@ -132,17 +322,17 @@ async def list_outputs(
     offset: int = Query(0, ge=0),
     start: Optional[str] = None,
     end: Optional[str] = None,
+    fmt: Literal["rows", "columnar"] = Query("rows", alias="format"),
     db: aiosqlite.Connection = Depends(get_db),
 ):
-    rows, total = await _list_by_time(db, "outputs", "TIMESTAMP", limit, offset, start, end)
-    return {"items": rows, "total": total, "limit": limit, "offset": offset}
+    rows, total = await _list_by_time(
+        db, "outputs", "TIMESTAMP", limit, offset, start, end, fmt == "columnar"
+    )
+    return _page("outputs", rows, total, limit, offset, fmt)
 
 @router.get("/outputs/latest", tags=["outputs"])
 async def latest_outputs(db: aiosqlite.Connection = Depends(get_db)):
-    cur = await db.execute("SELECT * FROM outputs ORDER BY TIMESTAMP DESC LIMIT 1;")
-    row = await cur.fetchone()
-    await cur.close()
-    return dict(row) if row else None
+    return await _latest(db, "outputs")
 
 @router.get("/outputs/{id}", tags=["outputs"])
 async def get_outputs(id: int, db: aiosqlite.Connection = Depends(get_db)):
@@ -152,8 +342,8 @@ async def get_outputs(id: int, db: aiosqlite.Connection = Depends(get_db)):
     return row
 
 @router.delete("/outputs/{id}", status_code=204, tags=["outputs"])
-async def delete_outputs(id: int, db: aiosqlite.Connection = Depends(get_db)):
-    if await _delete_by_id(db, "outputs", id) == 0:
+async def delete_outputs(id: int, writer: Writer = Depends(get_write)):
+    if await _delete_by_id(writer, "outputs", id) == 0:
         raise HTTPException(404, "outputs not found")
 
 
@@ -162,12 +352,11 @@ async def delete_outputs(id: int, db: aiosqlite.Connection = Depends(get_db)):
 # ----------------------------------------------------------------------
 @router.post("/hydrophone", tags=["hydrophone"])
 async def create_hydrophone(
-    HEADING: str = Form(...),
-    db: aiosqlite.Connection = Depends(get_db),
+    row: HydrophoneCreate = Depends(HydrophoneCreate.as_form),
+    writer: Writer = Depends(get_write),
 ):
-    cols = ["HEADING"]
-    vals = [HEADING]
-    return await _insert_and_fetch(db, "hydrophone", cols, vals)
+    data = row.model_dump(exclude_none=True)
+    return await _insert_and_fetch(writer, "hydrophone", tuple(data), tuple(data.values()))
 
 @router.get("/hydrophone", tags=["hydrophone"])
 async def list_hydrophone(
@@ -175,17 +364,17 @@ async def list_hydrophone(
     offset: int = Query(0, ge=0),
     start: Optional[str] = None,
     end: Optional[str] = None,
+    fmt: Literal["rows", "columnar"] = Query("rows", alias="format"),
     db: aiosqlite.Connection = Depends(get_db),
 ):
-    rows, total = await _list_by_time(db, "hydrophone", "TIMESTAMP", limit, offset, start, end)
-    return {"items": rows, "total": total, "limit": limit, "offset": offset}
+    rows, total = await _list_by_time(
+        db, "hydrophone", "TIMESTAMP", limit, offset, start, end, fmt == "columnar"
+    )
+    return _page("hydrophone", rows, total, limit, offset, fmt)
 
 @router.get("/hydrophone/latest", tags=["hydrophone"])
 async def latest_hydrophone(db: aiosqlite.Connection = Depends(get_db)):
-    cur = await db.execute("SELECT * FROM hydrophone ORDER BY TIMESTAMP DESC LIMIT 1;")
-    row = await cur.fetchone()
-    await cur.close()
-    return dict(row) if row else None
+    return await _latest(db, "hydrophone")
 
 @router.get("/hydrophone/{id}", tags=["hydrophone"])
 async def get_hydrophone(id: int, db: aiosqlite.Connection = Depends(get_db)):
@@ -195,8 +384,8 @@ async def get_hydrophone(id: int, db: aiosqlite.Connection = Depends(get_db)):
     return row
 
 @router.delete("/hydrophone/{id}", status_code=204, tags=["hydrophone"])
-async def delete_hydrophone(id: int, db: aiosqlite.Connection = Depends(get_db)):
-    if await _delete_by_id(db, "hydrophone", id) == 0:
+async def delete_hydrophone(id: int, writer: Writer = Depends(get_write)):
+    if await _delete_by_id(writer, "hydrophone", id) == 0:
         raise HTTPException(404, "hydrophone not found")
 
 
@@ -205,12 +394,11 @@ async def delete_hydrophone(id: int, db: aiosqlite.Connection = Depends(get_db))
 # ----------------------------------------------------------------------
 @router.post("/depth", tags=["depth"])
 async def create_depth(
-    DEPTH: float = Form(...),
-    db: aiosqlite.Connection = Depends(get_db),
+    row: DepthCreate = Depends(DepthCreate.as_form),
+    writer: Writer = Depends(get_write),
 ):
-    cols = ["DEPTH"]
-    vals = [DEPTH]
-    return await _insert_and_fetch(db, "depth", cols, vals)
+    data = row.model_dump(exclude_none=True)
+    return await _insert_and_fetch(writer, "depth", tuple(data), tuple(data.values()))
 
 @router.get("/depth", tags=["depth"])
 async def list_depth(
@@ -218,17 +406,17 @@ async def list_depth(
     offset: int = Query(0, ge=0),
     start: Optional[str] = None,
     end: Optional[str] = None,
+    fmt: Literal["rows", "columnar"] = Query("rows", alias="format"),
     db: aiosqlite.Connection = Depends(get_db),
 ):
-    rows, total = await _list_by_time(db, "depth", "TIMESTAMP", limit, offset, start, end)
-    return {"items": rows, "total": total, "limit": limit, "offset": offset}
+    rows, total = await _list_by_time(
+        db, "depth", "TIMESTAMP", limit, offset, start, end, fmt == "columnar"
+    )
+    return _page("depth", rows, total, limit, offset, fmt)
 
 @router.get("/depth/latest", tags=["depth"])
 async def latest_depth(db: aiosqlite.Connection = Depends(get_db)):
-    cur = await db.execute("SELECT * FROM depth ORDER BY TIMESTAMP DESC LIMIT 1;")
-    row = await cur.fetchone()
-    await cur.close()
-    return dict(row) if row else None
+    return await _latest(db, "depth")
 
 @router.get("/depth/{id}", tags=["depth"])
 async def get_depth(id: int, db: aiosqlite.Connection = Depends(get_db)):
@@ -238,8 +426,8 @@ async def get_depth(id: int, db: aiosqlite.Connection = Depends(get_db)):
     return row
 
 @router.delete("/depth/{id}", status_code=204, tags=["depth"])
-async def delete_depth(id: int, db: aiosqlite.Connection = Depends(get_db)):
-    if await _delete_by_id(db, "depth", id) == 0:
+async def delete_depth(id: int, writer: Writer = Depends(get_write)):
+    if await _delete_by_id(writer, "depth", id) == 0:
         raise HTTPException(404, "depth not found")
 
 
@@ -248,14 +436,18 @@ async def delete_depth(id: int, db: aiosqlite.Connection = Depends(get_db)):
 # ----------------------------------------------------------------------
 @router.post("/imu", tags=["imu"])
 async def create_imu(
-    ACCEL_X: float = Form(...), ACCEL_Y: float = Form(...), ACCEL_Z: float = Form(...),
-    GYRO_X: float = Form(...),  GYRO_Y: float = Form(...),  GYRO_Z: float = Form(...),
-    MAG_X: float = Form(...),   MAG_Y: float = Form(...),   MAG_Z: float = Form(...),
-    db: aiosqlite.Connection = Depends(get_db),
+    row: ImuCreate = Depends(ImuCreate.as_form),
+    writer: Writer = Depends(get_write),
+):
+    data = row.model_dump(exclude_none=True)
+    return await _insert_and_fetch(writer, "imu", tuple(data), tuple(data.values()))
+
+@router.post("/imu/bulk", tags=["imu"])
+async def create_imu_bulk(
+    rows: list[ImuCreate] = Body(..., max_length=_BULK_MAX),
+    writer: Writer = Depends(get_write),
 ):
-    cols = ["ACCEL_X", "ACCEL_Y", "ACCEL_Z", "GYRO_X", "GYRO_Y", "GYRO_Z", "MAG_X", "MAG_Y", "MAG_Z"]
-    vals = [ACCEL_X, ACCEL_Y, ACCEL_Z, GYRO_X, GYRO_Y, GYRO_Z, MAG_X, MAG_Y, MAG_Z]
-    return await _insert_and_fetch(db, "imu", cols, vals)
+    return await _insert_many(writer, "imu", ImuCreate, rows)
 
 @router.get("/imu", tags=["imu"])
 async def list_imu(
@@ -263,17 +455,17 @@ async def list_imu(
     offset: int = Query(0, ge=0),
     start: Optional[str] = None,
     end: Optional[str] = None,
+    fmt: Literal["rows", "columnar"] = Query("rows", alias="format"),
     db: aiosqlite.Connection = Depends(get_db),
 ):
-    rows, total = await _list_by_time(db, "imu", "TIMESTAMP", limit, offset, start, end)
-    return {"items": rows, "total": total, "limit": limit, "offset": offset}
+    rows, total = await _list_by_time(
+        db, "imu", "TIMESTAMP", limit, offset, start, end, fmt == "columnar"
+    )
+    return _page("imu", rows, total, limit, offset, fmt)
 
 @router.get("/imu/latest", tags=["imu"])
 async def latest_imu(db: aiosqlite.Connection = Depends(get_db)):
-    cur = await db.execute("SELECT * FROM imu ORDER BY TIMESTAMP DESC LIMIT 1;")
-    row = await cur.fetchone()
-    await cur.close()
-    return dict(row) if row else None
+    return await _latest(db, "imu")
 
 @router.get("/imu/{id}", tags=["imu"])
 async def get_imu(id: int, db: aiosqlite.Connection = Depends(get_db)):
@@ -283,8 +475,8 @@ async def get_imu(id: int, db: aiosqlite.Connection = Depends(get_db)):
     return row
 
 @router.delete("/imu/{id}", status_code=204, tags=["imu"])
-async def delete_imu(id: int, db: aiosqlite.Connection = Depends(get_db)):
-    if await _delete_by_id(db, "imu", id) == 0:
+async def delete_imu(id: int, writer: Writer = Depends(get_write)):
+    if await _delete_by_id(writer, "imu", id) == 0:
         raise HTTPException(404, "imu not found")
 
 
@@ -293,22 +485,18 @@ async def delete_imu(id: int, db: aiosqlite.Connection = Depends(get_db)):
 # ----------------------------------------------------------------------
 @router.post("/power_safety", tags=["power_safety"])
 async def create_power_safety(
-    B1_VOLTAGE: int = Form(...), B2_VOLTAGE: int = Form(...), B3_VOLTAGE: int = Form(...),
-    B1_CURRENT: int = Form(...), B2_CURRENT: int = Form(...), B3_CURRENT: int = Form(...),
-    B1_TEMP: int = Form(...),    B2_TEMP: int = Form(...),    B3_TEMP: int = Form(...),
-    db: aiosqlite.Connection = Depends(get_db),
+    row: PowerSafetyCreate = Depends(PowerSafetyCreate.as_form),
+    writer: Writer = Depends(get_write),
 ):
-    cols = [
-        "B1_VOLTAGE", "B2_VOLTAGE", "B3_VOLTAGE",
-        "B1_CURRENT", "B2_CURRENT", "B3_CURRENT",
-        "B1_TEMP", "B2_TEMP", "B3_TEMP"
-    ]
-    vals = [
-        B1_VOLTAGE, B2_VOLTAGE, B3_VOLTAGE,
-        B1_CURRENT, B2_CURRENT, B3_CURRENT,
-        B1_TEMP, B2_TEMP, B3_TEMP
-    ]
-    return await _insert_and_fetch(db, "power_safety", cols, vals)
+    data = row.model_dump(exclude_none=True)
+    return await _insert_and_fetch(writer, "power_safety", tuple(data), tuple(data.values()))
+
+@router.post("/power_safety/bulk", tags=["power_safety"])
+async def create_power_safety_bulk(
+    rows: list[PowerSafetyCreate] = Body(..., max_length=_BULK_MAX),
+    writer: Writer = Depends(get_write),
+):
+    return await _insert_many(writer, "power_safety", PowerSafetyCreate, rows)
 
 @router.get("/power_safety", tags=["power_safety"])
 async def list_power_safety(
@@ -316,17 +504,17 @@ async def list_power_safety(
     offset: int = Query(0, ge=0),
     start: Optional[str] = None,
     end: Optional[str] = None,
+    fmt: Literal["rows", "columnar"] = Query("rows", alias="format"),
     db: aiosqlite.Connection = Depends(get_db),
 ):
-    rows, total = await _list_by_time(db, "power_safety", "TIMESTAMP", limit, offset, start, end)
-    return {"items": rows, "total": total, "limit": limit, "offset": offset}
+    rows, total = await _list_by_time(
+        db, "power_safety", "TIMESTAMP", limit, offset, start, end, fmt == "columnar"
+    )
+    return _page("power_safety", rows, total, limit, offset, fmt)
 
 @router.get("/power_safety/latest", tags=["power_safety"])
 async def latest_power_safety(db: aiosqlite.Connection = Depends(get_db)):
-    cur = await db.execute("SELECT * FROM power_safety ORDER BY TIMESTAMP DESC LIMIT 1;")
-    row = await cur.fetchone()
-    await cur.close()
-    return dict(row) if row else None
+    return await _latest(db, "power_safety")
 
 @router.get("/power_safety/{id}", tags=["power_safety"])
 async def get_power_safety(id: int, db: aiosqlite.Connection = Depends(get_db)):
@@ -336,6 +524,6 @@ async def get_power_safety(id: int, db: aiosqlite.Connection = Depends(get_db)):
     return row
 
 @router.delete("/power_safety/{id}", status_code=204, tags=["power_safety"])
-async def delete_power_safety(id: int, db: aiosqlite.Connection = Depends(get_db)):
-    if await _delete_by_id(db, "power_safety", id) == 0:
+async def delete_power_safety(id: int, writer: Writer = Depends(get_write)):
+    if await _delete_by_id(writer, "power_safety", id) == 0:
         raise HTTPException(404, "power_safety not found")
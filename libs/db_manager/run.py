@@ -1,10 +1,17 @@
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 
 from deps import lifespan
 import routers
 
 
-app = FastAPI(title="AUV DB API", version="1.0.0", lifespan=lifespan)
+# orjson encodes the row dicts in native code instead of the stdlib json module
+app = FastAPI(
+    title="AUV DB API",
+    version="1.0.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
+)
 
 # Register all routes
 app.include_router(routers.router)
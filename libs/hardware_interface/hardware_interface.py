@@ -1,10 +1,13 @@
 import argparse
 import logging
 import signal
+import sys
 import time
+from pathlib import Path
 
-from logging_config import setup_logging
+from libs.logging_config import setup_logging
 
+_LIBS_DIR = Path(__file__).resolve().parent.parent
 _RECONCILE_INTERVAL: float = 5.0
 _log = logging.getLogger(__name__)
 
@@ -29,7 +32,11 @@ def run(simulation: bool = False) -> None:
         # SimulationController().run()
         return
 
-    from hardware_interface.process_manager import HardwareProcessManager
+    # The controller modules use bare imports (config, quick_request,
+    # hardware_interface.*), same as libs/process_manager.py sets up.
+    sys.path.insert(0, str(_LIBS_DIR))
+
+    from libs.hardware_interface.process_manager import HardwareProcessManager
     pm = HardwareProcessManager()
 
     _log.info("hardware_interface started")
@@ -1,25 +1,67 @@
+import errno
+import threading
+
 from smbus2 import SMBus, i2c_msg
 
+# One open handle per bus, shared by every controller thread. Transfers on a
+# bus are serialised by its lock (the kernel serialises them on the adapter
+# anyway), so the handle is never closed under a transfer in flight.
+_buses: dict[int, SMBus] = {}
+_locks: dict[int, threading.Lock] = {}
+_locks_lock = threading.Lock()
+
+# Errors that mean the adapter or fd itself is gone, not that one device
+# NACKed (EREMOTEIO / ENXIO / ETIMEDOUT leave the handle usable).
+_RESET_ERRNOS = frozenset({errno.ENODEV, errno.EBADF})
+
+
+def _lock(bus_number: int) -> threading.Lock:
+    lock = _locks.get(bus_number)
+    if lock is None:
+        with _locks_lock:
+            lock = _locks.setdefault(bus_number, threading.Lock())
+    return lock
+
+
+def transfer(bus_number: int, *msgs: i2c_msg) -> None:
+    """Run prebuilt messages as one combined transaction (lets callers reuse an i2c_msg)."""
+    with _lock(bus_number):
+        bus = _buses.get(bus_number)
+        if bus is None:
+            bus = _buses[bus_number] = SMBus(bus_number)
+        try:
+            bus.i2c_rdwr(*msgs)
+        except OSError as e:
+            if e.errno in _RESET_ERRNOS:
+                # Reopen on the next call since the adapter itself went away
+                del _buses[bus_number]
+                bus.close()
+            raise
+
+
+def close(bus_number: int) -> None:
+    """Close the cached handle for *bus_number*, if one is open."""
+    with _lock(bus_number):
+        bus = _buses.pop(bus_number, None)
+        if bus is not None:
+            bus.close()
+
 
 def write(bus_number: int, address: int, data: bytes) -> None:
     """Write bytes to an I2C device."""
-    with SMBus(bus_number) as bus:
-        msg = i2c_msg.write(address, list(data))
-        bus.i2c_rdwr(msg)
+    transfer(bus_number, i2c_msg.write(address, data))
 
 
 def read(bus_number: int, address: int, length: int) -> bytes:
     """Read bytes from an I2C device."""
-    with SMBus(bus_number) as bus:
-        msg = i2c_msg.read(address, length)
-        bus.i2c_rdwr(msg)
-        return bytes(msg)
+    msg = i2c_msg.read(address, length)
+    transfer(bus_number, msg)
+    return bytes(msg)
 
 
 def read_register(bus_number: int, address: int, register: int, length: int) -> bytes:
     """Write a register address then read the response (standard register-based protocol)."""
-    with SMBus(bus_number) as bus:
-        write_msg = i2c_msg.write(address, [register])
-        read_msg = i2c_msg.read(address, length)
-        bus.i2c_rdwr(write_msg, read_msg)
-        return bytes(read_msg)
\ No newline at end of file
+    write_msg = i2c_msg.write(address, [register])
+    read_msg = i2c_msg.read(address, length)
+    transfer(bus_number, write_msg, read_msg)
+    return bytes(read_msg)
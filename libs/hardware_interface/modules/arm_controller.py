@@ -1,10 +1,15 @@
 import argparse
-import time
+import logging
+
+from smbus2 import i2c_msg
 
 from config import get_env
-from hardware_interface.i2c_commands import write
+from hardware_interface.i2c_commands import transfer, write
+from hardware_interface.pacing import Pacer
 from quick_request import AUVClient
 
+_log = logging.getLogger(__name__)
+
 _BUS: int = int(get_env("I2C_BUS_NUMBER", required=True))
 _ADDRESS: int = int(get_env("ARM_ADDRESS", required=True), 16)
 
@@ -13,6 +18,11 @@ _MIN: int = 0
 _MAX: int = 255
 _NEUTRAL: int = 127
 
+# update() only ever sends fully retracted or fully extended, so build those
+# two register writes once instead of per 20 Hz tick
+_MSG_RETRACTED = i2c_msg.write(_ADDRESS, bytes((_REGISTER, _MIN)))
+_MSG_EXTENDED = i2c_msg.write(_ADDRESS, bytes((_REGISTER, _MAX)))
+
 def _clamp(value: int) -> int:
     return max(_MIN, min(_MAX, value))
 
@@ -26,24 +36,28 @@ def set_arm_position(val: int) -> None:
 class ArmController:
     def __init__(self) -> None:
         self.auv_client = AUVClient()
+        self._idle = False  # True while the last poll found no row
 
     def update(self) -> None:
         """Fetch the latest arm command from the API and send to the arm controller."""
         data = self.auv_client.latest("inputs")
         if data is None:
-            print("No input commands available.")
+            # Warn once when inputs goes empty instead of every tick; repeats go to DEBUG
+            _log.log(logging.DEBUG if self._idle else logging.WARNING, "No input commands available.")
+            self._idle = True
             return
+        self._idle = False
 
         # S1 is a boolean field (0=retracted, 1=extended)
-        arm_position = _MAX if data.get("S1", 0) else _MIN
-        set_arm_position(arm_position)
+        transfer(_BUS, _MSG_EXTENDED if data.get("S1", 0) else _MSG_RETRACTED)
 
     def run(self) -> None:
         """Continuously update the arm controller with the latest commands from the API."""
         try:
+            pacer = Pacer(0.05)  # 20 Hz
             while True:
                 self.update()
-                time.sleep(0.05)  # 20 Hz
+                pacer.wait()
         except KeyboardInterrupt:
             print("ArmController stopped by user.")
 
@@ -1,10 +1,16 @@
 import argparse
-import time
+import ctypes
+import logging
+
+from smbus2 import i2c_msg
 
 from config import get_env
-from hardware_interface.i2c_commands import write
+from hardware_interface.i2c_commands import transfer, write
+from hardware_interface.pacing import Pacer
 from quick_request import AUVClient
 
+_log = logging.getLogger(__name__)
+
 _BUS: int = int(get_env("I2C_BUS_NUMBER", required=True))
 _ADDRESS: int = int(get_env("ESC_ADDRESS", required=True), 16)
 
@@ -13,8 +19,15 @@ _MIN: int = 0
 _MAX: int = 255
 _NEUTRAL: int = 127
 
+_MOTOR_KEYS: tuple[str, ...] = (
+    "MOTOR1", "MOTOR2", "MOTOR3", "MOTOR4", "MOTOR5", "MOTOR6", "MOTOR7", "MOTOR8",
+)
+
 
 def _clamp(value: float) -> int:
+    # Fast path for the common case: outputs rows carry INTEGER motor values
+    if type(value) is int:
+        return _MIN if value < _MIN else (_MAX if value > _MAX else value)
     return max(_MIN, min(_MAX, round(value)))
 
 
@@ -32,31 +45,37 @@ def set_thrust(
 class ESCController:
     def __init__(self) -> None:
         self.auv_client = AUVClient()
+        self._idle = False  # True while the last poll found no row
+        # One write message reused every tick. _payload views its ctypes buffer
+        # ([register, motor1..motor8]), so a tick only overwrites those bytes.
+        self._msg = i2c_msg.write(_ADDRESS, bytes(1 + len(_MOTOR_KEYS)))
+        self._payload = ctypes.cast(
+            self._msg.buf, ctypes.POINTER(ctypes.c_uint8 * self._msg.len)
+        ).contents
+        self._payload[0] = _REGISTER
 
     def update(self) -> None:
         """Fetch the latest desired thrust values from the API and send to ESCs."""
         data = self.auv_client.latest("outputs")
         if data is None:
-            print("No output commands available.")
+            # Warn once when outputs goes empty instead of every tick; repeats go to DEBUG
+            _log.log(logging.DEBUG if self._idle else logging.WARNING, "No output commands available.")
+            self._idle = True
             return
+        self._idle = False
 
-        set_thrust(
-            data.get("MOTOR1", _NEUTRAL),
-            data.get("MOTOR2", _NEUTRAL),
-            data.get("MOTOR3", _NEUTRAL),
-            data.get("MOTOR4", _NEUTRAL),
-            data.get("MOTOR5", _NEUTRAL),
-            data.get("MOTOR6", _NEUTRAL),
-            data.get("MOTOR7", _NEUTRAL),
-            data.get("MOTOR8", _NEUTRAL),
-        )
+        payload = self._payload
+        for i, key in enumerate(_MOTOR_KEYS, 1):
+            payload[i] = _clamp(data.get(key, _NEUTRAL))
+        transfer(_BUS, self._msg)
 
     def run(self) -> None:
         """Continuously update ESCs with the latest commands from the API."""
         try:
+            pacer = Pacer(0.05)  # 20 Hz
             while True:
                 self.update()
-                time.sleep(0.05)  # 20 Hz
+                pacer.wait()
         except KeyboardInterrupt:
             print("ESCController stopped by user.")
 
@@ -1,9 +1,13 @@
 import argparse
+import logging
 import struct
-import time
+import threading
+from collections import deque
+from collections.abc import Iterator
 
 from config import get_env
 from hardware_interface.i2c_commands import read as i2c_read
+from hardware_interface.pacing import Pacer
 from quick_request import AUVClient
 
 _BUS: int = int(get_env("I2C_BUS_NUMBER", required=True))
@@ -11,14 +15,20 @@ _ADDRESS: int = int(get_env("IMU_ADDRESS", required=True).strip(), 16)
 
 # 14-byte packet from the IMU Pico:
 # index(u8) yaw(i16) pitch(i16) roll(i16) ax(i16) ay(i16) az(i16) accuracy(u8)
-_PACKET_LEN = 14
-_PACKET_FMT = "<BhhhhhhB"
+_PACKET = struct.Struct("<BhhhhhhB")  # compiled once; skips the format-string cache per read
+_PACKET_LEN = _PACKET.size
 
 # Raw value ranges used for 0-255 linear mapping
 _ANGLE_RANGE = (-18000, 18000)  # 1/100°, per protocol spec
 _ACCEL_RANGE = (-3924, 3924)    # 1/100 m/s², ±4 g
 _ACCURACY_RANGE = (0, 3)
 
+_READ_PERIOD = 0.02     # I2C poll rate of the background reader (50 Hz)
+_PUBLISH_PERIOD = 0.05  # DB publish rate (20 Hz)
+
+_log = logging.getLogger(__name__)
+_read_failing = False
+
 
 def _to_u8(value: int | float, lo: float, hi: float) -> int:
     """Map value from [lo, hi] to 0-255, clamping out-of-range inputs."""
@@ -26,42 +36,117 @@ def _to_u8(value: int | float, lo: float, hi: float) -> int:
     return round((clamped - lo) / (hi - lo) * 255)
 
 
+def _u8_table(lo: int, hi: int) -> bytes:
+    """_to_u8 precomputed for every int16, indexed by value + 32768 (clamped outside [lo, hi])."""
+    return (
+        bytes(lo + 32768)
+        + bytes(_to_u8(v, lo, hi) for v in range(lo, hi + 1))
+        + b"\xff" * (32767 - hi)
+    )
+
+
+# Packet fields are int16, so a 64 KiB table per range replaces the float
+# clamp/scale/round for each channel with one index
+_ANGLE_U8 = _u8_table(*_ANGLE_RANGE)
+_ACCEL_U8 = _u8_table(*_ACCEL_RANGE)
+
+
+def read_packet() -> tuple[int, ...] | None:
+    """Read one raw IMU packet and unpack it straight from bytes, or None on error."""
+    global _read_failing
+    try:
+        raw = i2c_read(_BUS, _ADDRESS, _PACKET_LEN)
+    except OSError as e:
+        # Warn once when the Pico drops off; repeats at the poll rate go to DEBUG
+        _log.log(logging.DEBUG if _read_failing else logging.WARNING, "IMU I2C read error: %s", e)
+        _read_failing = True
+        return None
+    _read_failing = False
+
+    if len(raw) != _PACKET_LEN:
+        return None
+    return _PACKET.unpack(raw)
+
+
 class ImuController:
     def __init__(self) -> None:
         self.auv_client = AUVClient()
-
-    def update(self) -> None:
-        """Read one IMU packet from the Pico and post mapped values to the DB API."""
+        # Ring buffer filled by the reader thread; the newest packet is [-1]
+        self._buf: deque[tuple[int, ...]] = deque(maxlen=256)
+        self._stop = threading.Event()
+
+    def samples(self, period: float = 0.05) -> Iterator[tuple[int, ...]]:
+        """
+        Yield unpacked IMU packets, one per *period* seconds.
+
+        The caller pulls samples at its own pace, so a slow consumer (e.g. a
+        blocked DB POST) delays the next I2C read instead of queueing reads.
+        """
+        pacer = Pacer(period)
+        while not self._stop.is_set():
+            packet = read_packet()
+            if packet is not None:
+                yield packet
+            # The read and the consumer's work don't add to the period
+            pacer.wait()
+
+    def _pump(self) -> None:
+        """Reader thread: drain I2C packets into the ring buffer."""
+        for packet in self.samples(_READ_PERIOD):
+            self._buf.append(packet)
+
+    def latest(self) -> tuple[int, ...] | None:
+        """Most recent packet read by the background thread, or None before the first."""
         try:
-            raw = i2c_read(_BUS, _ADDRESS, _PACKET_LEN)
-        except OSError as e:
-            print(f"IMU I2C read error: {e}")
-            return
+            return self._buf[-1]
+        except IndexError:
+            return None
 
-        if len(raw) != _PACKET_LEN:
-            return
-
-        _, yaw, pitch, roll, ax, ay, az, accuracy = struct.unpack(_PACKET_FMT, raw)
+    def publish(self, packet: tuple[int, ...]) -> None:
+        """Post one unpacked IMU packet to the DB API as 0-255 mapped values."""
+        _, yaw, pitch, roll, ax, ay, az, _accuracy = packet
 
         self.auv_client.post(
             "imu",
-            ACCEL_X=_to_u8(ax, *_ACCEL_RANGE),
-            ACCEL_Y=_to_u8(ay, *_ACCEL_RANGE),
-            ACCEL_Z=_to_u8(az, *_ACCEL_RANGE),
-            GYRO_X=_to_u8(yaw, *_ANGLE_RANGE),
-            GYRO_Y=_to_u8(pitch, *_ANGLE_RANGE),
-            GYRO_Z=_to_u8(roll, *_ANGLE_RANGE),
+            ACCEL_X=_ACCEL_U8[ax + 32768],
+            ACCEL_Y=_ACCEL_U8[ay + 32768],
+            ACCEL_Z=_ACCEL_U8[az + 32768],
+            GYRO_X=_ANGLE_U8[yaw + 32768],
+            GYRO_Y=_ANGLE_U8[pitch + 32768],
+            GYRO_Z=_ANGLE_U8[roll + 32768],
             MAG_X=0, MAG_Y=0, MAG_Z=0,
         )
 
+    def update(self) -> None:
+        """Read one IMU packet from the Pico and post mapped values to the DB API."""
+        packet = read_packet()
+        if packet is not None:
+            self.publish(packet)
+
     def run(self) -> None:
-        """Continuously read the IMU Pico and publish data to the DB API at 20 Hz."""
+        """
+        Continuously read the IMU Pico and publish data to the DB API at 20 Hz.
+
+        I2C reads run on a background thread so a slow POST never stalls them;
+        this loop only publishes the newest packet, skipping ones already sent.
+        """
+        self._stop.clear()
+        reader = threading.Thread(target=self._pump, name="imu-reader", daemon=True)
+        reader.start()
+        last = None
+        pacer = Pacer(_PUBLISH_PERIOD)
         try:
             while True:
-                self.update()
-                time.sleep(0.05)
+                packet = self.latest()
+                if packet is not None and packet is not last:
+                    self.publish(packet)
+                    last = packet
+                pacer.wait()
         except KeyboardInterrupt:
             print("ImuController stopped by user.")
+        finally:
+            self._stop.set()
+            reader.join(timeout=1)
 
 
 def _test() -> None:
@@ -72,7 +157,7 @@ def _test() -> None:
         print(f"Unexpected packet length: {len(raw)}")
         return
 
-    idx, yaw, pitch, roll, ax, ay, az, accuracy = struct.unpack(_PACKET_FMT, raw)
+    idx, yaw, pitch, roll, ax, ay, az, accuracy = _PACKET.unpack(raw)
     print(f"  Frame index : {idx}")
     print(f"  ACCEL_X     : {ax / 100:.2f} m/s²  → {_to_u8(ax, *_ACCEL_RANGE)}")
     print(f"  ACCEL_Y     : {ay / 100:.2f} m/s²  → {_to_u8(ay, *_ACCEL_RANGE)}")
@@ -1,10 +1,10 @@
 import argparse
-import time
 
 from config import get_env
 from quick_request import AUVClient
 
 from hardware_interface.modules.ms5837 import MS5837
+from hardware_interface.pacing import Pacer
 
 _BUS: int = int(get_env("I2C_BUS_NUMBER", required=True))
 
@@ -22,16 +22,21 @@ class PressureController:
             print("MS5837 read error.")
             return
 
-        self.auv_client.post("depth", DEPTH=self.sensor.depth())
+        # Queued: the 20 Hz sample cadence doesn't wait on the DB round-trip
+        self.auv_client.post_nowait("depth", DEPTH=self.sensor.depth())
 
     def run(self) -> None:
         """Continuously read the pressure sensor and publish depth to the DB API at 20 Hz."""
         try:
+            pacer = Pacer(0.05)  # 20 Hz
             while True:
                 self.update()
-                time.sleep(0.05)
+                pacer.wait()
         except KeyboardInterrupt:
             print("PressureController stopped by user.")
+        finally:
+            # Flush queued depth rows and stop the client's writer thread
+            self.auv_client.close()
 
 
 def _test() -> None:
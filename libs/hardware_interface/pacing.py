@@ -0,0 +1,23 @@
+import time
+
+
+class Pacer:
+    """
+    Fixed-rate loop timer shared by the controller run loops.
+
+    Call ``wait()`` once per iteration: it sleeps to the next deadline, so time
+    spent in the loop body doesn't stretch the period. After an overrun it
+    resyncs to now instead of bursting to catch up.
+    """
+
+    def __init__(self, period: float) -> None:
+        self.period = period
+        self._next = time.monotonic()
+
+    def wait(self) -> None:
+        self._next += self.period
+        slack = self._next - time.monotonic()
+        if slack > 0:
+            time.sleep(slack)
+        else:
+            self._next = time.monotonic()
@@ -1,11 +1,13 @@
 import logging
 import threading
+import time
 from collections.abc import Callable
 
 from libs.config import get_env
 from libs.hardware_interface.scanner import scan_i2c_bus
 
 _RETRY_DELAY: float = 5.0
+_SCAN_TTL: float = 5.0  # reuse a bus scan for this long (status() is polled at 1 Hz by the UI)
 _log = logging.getLogger(__name__)
 
 
@@ -86,6 +88,26 @@ _NAME_TO_TARGET: dict[str, Callable[[threading.Event], None]] = {
 }
 
 
+def _read_config() -> tuple[tuple[str, bool, int | None], ...]:
+    """
+    (name, enabled, address) for every registered controller, parsed from .env.
+
+    A malformed address is logged and that controller is marked unavailable
+    (disabled, no address) so one bad entry can't stop the manager starting.
+    """
+    config = []
+    for flag_key, addr_key, name, _ in _REGISTRY:
+        enabled = get_env(flag_key, default="False").strip().lower() in ("true", "1", "yes")
+        addr_str = get_env(addr_key, default="").strip()
+        try:
+            address = int(addr_str, 16) if addr_str else None
+        except ValueError:
+            _log.error("%s=%r is not a hex address; %s unavailable", addr_key, addr_str, name)
+            enabled, address = False, None
+        config.append((name, enabled, address))
+    return tuple(config)
+
+
 class HardwareProcessManager:
     def __init__(self, dry_run: bool = False) -> None:
         """
@@ -96,26 +118,40 @@ class HardwareProcessManager:
         """
         self.dry_run = dry_run
         self._threads: dict[str, tuple[threading.Thread, threading.Event]] = {}
+        # .env is loaded once per process, so flags/addresses can't change
+        # after start-up; parse them here rather than on every reconcile.
+        self._config = _read_config()
+        self._scan: tuple[float, frozenset[int]] | None = None  # (monotonic time, addresses)
+
+    def _detected(self, bus: int, force: bool = False) -> frozenset[int]:
+        """
+        Addresses found on *bus*, rescanned at most every _SCAN_TTL seconds.
+
+        A scan probes all 117 addresses, so repeat callers within the TTL reuse
+        the last result; pass force=True for a fresh scan.
+        """
+        now = time.monotonic()
+        if not force and self._scan is not None and now - self._scan[0] < _SCAN_TTL:
+            return self._scan[1]
+        detected = frozenset(scan_i2c_bus(bus))
+        self._scan = (now, detected)
+        return detected
 
     def _is_alive(self, name: str) -> bool:
         entry = self._threads.get(name)
         return entry is not None and entry[0].is_alive()
 
-    def reconcile(self) -> None:
+    def reconcile(self, force: bool = False) -> None:
         """
         Scan the I2C bus and sync running threads against .env config.
         Starts a controller only when its flag is True AND its device is detected.
         Stops a controller when either condition becomes false.
+        A scan younger than _SCAN_TTL is reused unless *force* is set.
         """
         bus = int(get_env("I2C_BUS_NUMBER", required=True))
-        detected = set(scan_i2c_bus(bus))
-
-        for flag_key, addr_key, name, _ in _REGISTRY:
-            raw = get_env(flag_key, default="False").strip().lower()
-            enabled = raw in ("true", "1", "yes")
-            addr_str = get_env(addr_key, default="")
-            address = int(addr_str.strip(), 16) if addr_str.strip() else None
+        detected = self._detected(bus, force)
 
+        for name, enabled, address in self._config:
             should_run = enabled and address is not None and address in detected
 
             if should_run and not self._is_alive(name):
@@ -125,15 +161,31 @@ class HardwareProcessManager:
 
     def start_all(self) -> None:
         """Start all .env-enabled controllers regardless of I2C detection."""
-        for flag_key, _, name, _ in _REGISTRY:
-            raw = get_env(flag_key, default="False").strip().lower()
-            if raw in ("true", "1", "yes"):
+        for name, enabled, _ in self._config:
+            if enabled:
                 self._spawn(name)
 
     def stop_all(self) -> None:
-        """Stop all running controller threads."""
-        for name in list(self._threads):
-            self.stop(name)
+        """
+        Stop all running controller threads.
+
+        Every stop event is set before any join, so the threads wind down in
+        parallel and shutdown takes one timeout in the worst case, not one per
+        controller.
+        """
+        if self.dry_run:
+            for name in list(self._threads):
+                print(f"[dry_run] stop: {name}")
+            return
+        entries = list(self._threads.items())
+        self._threads.clear()
+        for _, (_, stop_event) in entries:
+            stop_event.set()
+        deadline = time.monotonic() + 5
+        for name, (thread, _) in entries:
+            thread.join(timeout=max(0.0, deadline - time.monotonic()))
+            if thread.is_alive():
+                _log.warning("%s thread did not exit within timeout", name)
 
     def start(self, name: str) -> None:
         """Manually start a controller by short name (e.g. 'esc')."""
@@ -165,19 +217,16 @@ class HardwareProcessManager:
         """
         try:
             bus = int(get_env("I2C_BUS_NUMBER", default="1"))
-            detected = set(scan_i2c_bus(bus))
+            detected = self._detected(bus)
         except OSError:
-            detected = set()
+            detected = frozenset()
 
         result: dict[str, dict] = {}
-        for flag_key, addr_key, name, _ in _REGISTRY:
+        for name, enabled, address in self._config:
             entry = self._threads.get(name)
             alive = entry is not None and entry[0].is_alive()
-            addr_str = get_env(addr_key, default="")
-            address = int(addr_str.strip(), 16) if addr_str.strip() else None
             result[name] = {
-                "enabled": get_env(flag_key, default="False").strip().lower()
-                in ("true", "1", "yes"),
+                "enabled": enabled,
                 "detected": address is not None and address in detected,
                 "running": alive,
                 "tid": entry[0].ident if alive else None,
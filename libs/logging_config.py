@@ -27,10 +27,16 @@ def setup_logging(process_label: str) -> None:
     All loggers in the process inherit this handler automatically.
     """
     root = logging.getLogger()
+    # Held for the whole setup: hardware controller threads call this together,
+    # and checking handlers outside the lock let several of them attach one each.
     with _setup_lock:
         if root.handlers:
             return
+        _configure_root(root, process_label)
+    logging.getLogger(__name__).info("process started")
+
 
+def _configure_root(root: logging.Logger, process_label: str) -> None:
     root.setLevel(logging.INFO)
 
     class _LabelFilter(logging.Filter):
@@ -44,4 +50,3 @@ def setup_logging(process_label: str) -> None:
     handler.setFormatter(logging.Formatter(_FORMAT, datefmt=_DATE))
     handler.addFilter(_LabelFilter())
     root.addHandler(handler)
-    logging.getLogger(__name__).info("process started")
@@ -14,6 +14,7 @@ Usage
     client.post("inputs",  SURGE=0, SWAY=0, HEAVE=0, ROLL=0, PITCH=0, YAW=0,
                            S1=0, S2=0, S3=0)
     client.post("depth",   DEPTH=1.23)
+    client.post_nowait("depth", DEPTH=1.23)     # queued; sent by a background thread
     client.post("imu",     ACCEL_X=0.1, ACCEL_Y=0.2, ACCEL_Z=9.8,
                            GYRO_X=0.0, GYRO_Y=0.0, GYRO_Z=0.0,
                            MAG_X=0.0, MAG_Y=0.0, MAG_Z=0.0)
@@ -31,10 +32,17 @@ Usage
 
 from __future__ import annotations
 
+import contextlib
+import logging
+import queue
+import threading
+import time
 from typing import Any
 
 import requests
 
+_log = logging.getLogger(__name__)
+
 
 class AUVRequestError(RuntimeError):
     """Raised when the API returns a non-2xx status."""
@@ -58,6 +66,11 @@ class AUVClient:
         self.base_url = base_url.rstrip("/")
         self.timeout  = timeout
         self._session = requests.Session()
+        # post_nowait() outbox, drained by a writer thread started on first use
+        # (None is the stop sentinel close() sends after the last row)
+        self._outbox: queue.Queue[tuple[str, dict] | None] = queue.Queue(maxsize=64)
+        self._writer: threading.Thread | None = None
+        self._writer_lock = threading.Lock()  # one writer even if posts race to start it
 
     # ------------------------------------------------------------------
     # Public API
@@ -75,6 +88,32 @@ class AUVClient:
         data = {k.upper(): v for k, v in fields.items()}
         return self._request("POST", f"/{table}", data=data)
 
+    def post_nowait(self, table: str, **fields: Any) -> None:
+        """
+        Queue a new row for *table* and return immediately.
+
+        A background thread sends queued rows in order, so a sensor loop never
+        waits on the API. Meant for telemetry: if the API falls behind and the
+        queue fills, the oldest pending row is dropped, and send failures are
+        logged rather than raised.
+        """
+        self._check_table(table)
+        data = {k.upper(): v for k, v in fields.items()}
+        if self._writer is None:
+            with self._writer_lock:
+                if self._writer is None:
+                    self._writer = threading.Thread(
+                        target=self._drain, name="auv-client-writer", daemon=True,
+                    )
+                    self._writer.start()
+        while True:
+            try:
+                self._outbox.put_nowait((f"/{table}", data))
+                return
+            except queue.Full:
+                with contextlib.suppress(queue.Empty):
+                    self._outbox.get_nowait()
+
     def latest(self, table: str) -> dict | None:
         """Return the most-recent row from *table*, or None if empty."""
         self._check_table(table)
@@ -91,21 +130,22 @@ class AUVClient:
         *,
         limit: int = 50,
         offset: int = 0,
-        start: str | None = None,
-        end:   str | None = None,
+        start: str | int | None = None,
+        end:   str | int | None = None,
     ) -> dict:
         """
         Return a paginated list of rows from *table*.
 
         Response shape: {"items": [...], "total": int, "limit": int, "offset": int}
 
-        *start* / *end* are optional ISO-8601 UTC strings to filter by TIMESTAMP.
+        *start* / *end* are optional ISO-8601 UTC strings (or epoch-millisecond
+        integers) to filter by TIMESTAMP, which the API stores as epoch ms.
         """
         self._check_table(table)
         params: dict[str, Any] = {"limit": limit, "offset": offset}
-        if start:
+        if start is not None:
             params["start"] = start
-        if end:
+        if end is not None:
             params["end"] = end
         return self._request("GET", f"/{table}", params=params)
 
@@ -146,8 +186,39 @@ class AUVClient:
             return None
         return resp.json()
 
-    def close(self) -> None:
-        """Release the underlying connection pool."""
+    def _drain(self) -> None:
+        # Own session: requests.Session is not safe to share with the caller's thread
+        session = requests.Session()
+        while True:
+            item = self._outbox.get()
+            if item is None:
+                session.close()
+                return
+            path, data = item
+            url = self.base_url + path
+            try:
+                resp = session.post(url, data=data, timeout=self.timeout)
+                if not resp.ok:
+                    _log.warning("POST %s → %s: %s", url, resp.status_code, resp.text)
+            except requests.RequestException as e:
+                _log.warning("POST %s failed: %s", url, e)
+
+    def close(self, timeout: float = 5.0) -> None:
+        """
+        Release the underlying connection pools.
+
+        Rows still queued by post_nowait() are sent first: the writer thread
+        gets up to *timeout* seconds to flush and exit before they are dropped.
+        """
+        with self._writer_lock:
+            writer, self._writer = self._writer, None
+        if writer is not None:
+            deadline = time.monotonic() + timeout
+            with contextlib.suppress(queue.Full):
+                self._outbox.put(None, timeout=timeout)
+            writer.join(max(0.0, deadline - time.monotonic()))
+            if writer.is_alive():
+                _log.warning("AUVClient writer did not flush within %.1fs", timeout)
         self._session.close()
 
     # Support use as a context manager
@@ -195,8 +266,8 @@ def list_rows(
     *,
     limit:  int = 50,
     offset: int = 0,
-    start:  str | None = None,
-    end:    str | None = None,
+    start:  str | int | None = None,
+    end:    str | int | None = None,
 ) -> dict:
     return _get_default().list(table, limit=limit, offset=offset, start=start, end=end)
 
@@ -0,0 +1,147 @@
+import json
+import math
+
+import deps
+import pytest
+import routers
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+
+def _imu(**overrides) -> dict:
+    row = {
+        "ACCEL_X": 0.1, "ACCEL_Y": 0.2, "ACCEL_Z": 9.8,
+        "GYRO_X": 0.0, "GYRO_Y": 0.0, "GYRO_Z": 0.0,
+        "MAG_X": 0.0, "MAG_Y": 0.0, "MAG_Z": 0.0,
+    }
+    row.update(overrides)
+    return row
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    """
+    @brief API client over a fresh auv_database.db in a temp directory.
+    """
+    monkeypatch.chdir(tmp_path)
+    app = FastAPI(lifespan=deps.lifespan)
+    app.include_router(routers.router)
+    with TestClient(app, raise_server_exceptions=False) as c:
+        yield c
+
+
+def test_form_insert_parses_strings_into_model(client) -> None:
+    """
+    @brief Form fields (always strings) are parsed once by the Create model.
+    """
+    row = client.post("/depth", data={"DEPTH": "1.5", "TIMESTAMP": "42"}).json()
+    assert (row["DEPTH"], row["TIMESTAMP"]) == (1.5, 42)
+
+
+def test_form_validation_errors_use_body_loc(client) -> None:
+    """
+    @brief Model constraint errors come back like FastAPI's own: loc = ["body", field].
+    """
+    resp = client.post("/inputs", data={
+        "SURGE": 0, "SWAY": 0, "HEAVE": 0, "ROLL": 0, "PITCH": 0, "YAW": 0,
+        "S1": 2, "S2": 0, "S3": 0, "ARM": 0,
+    })
+    assert resp.status_code == 422
+    assert [e["loc"] for e in resp.json()["detail"]] == [["body", "S1"]]
+
+    resp = client.post("/depth", data={})
+    assert resp.status_code == 422
+    assert [e["loc"] for e in resp.json()["detail"]] == [["body", "DEPTH"]]
+
+
+def test_bulk_insert_keeps_caller_timestamps(client) -> None:
+    """
+    @brief Buffered samples keep their TIMESTAMP; rows without one get server time.
+    """
+    resp = client.post("/imu/bulk", json=[_imu(TIMESTAMP=5), _imu(TIMESTAMP=6), _imu()])
+    assert resp.status_code == 200
+    assert resp.json() == {"inserted": 3}
+
+    stamps = sorted(r["TIMESTAMP"] for r in client.get("/imu").json()["items"])
+    assert stamps[:2] == [5, 6]
+    assert stamps[2] > 1_000_000_000_000  # epoch ms "now"
+
+
+def test_failed_bulk_insert_leaves_no_rows(client) -> None:
+    """
+    @brief A row failing mid-batch rolls back the whole batch, even after a later commit.
+    """
+    batch = [_imu(TIMESTAMP=1), _imu(TIMESTAMP=2), _imu(TIMESTAMP=3), _imu(ACCEL_X=math.nan)]
+    # json.dumps writes NaN (httpx's json= refuses to); SQLite stores it as NULL
+    body = json.dumps(batch)
+    resp = client.post("/imu/bulk", content=body, headers={"Content-Type": "application/json"})
+    assert resp.status_code == 422
+
+    # The next writer's commit must not persist the first three rows
+    assert client.post("/imu", data=_imu(TIMESTAMP=10)).status_code == 200
+    page = client.get("/imu").json()
+    assert page["total"] == 1
+    assert page["items"][0]["TIMESTAMP"] == 10
+
+
+def test_bulk_insert_caps_batch_size(client) -> None:
+    """
+    @brief Oversized batches are rejected before they take the write lock.
+    """
+    resp = client.post("/imu/bulk", json=[_imu()] * (routers._BULK_MAX + 1))
+    assert resp.status_code == 422
+    assert client.get("/imu").json()["total"] == 0
+
+
+def test_purge_deletes_only_older_rows(client) -> None:
+    """
+    @brief DELETE /{table}/purge removes rows strictly before the cutoff.
+    """
+    client.post("/imu/bulk", json=[_imu(TIMESTAMP=t) for t in (100, 200, 300)])
+
+    assert client.delete("/imu/purge", params={"before": 250}).json() == {"deleted": 2}
+    assert [r["TIMESTAMP"] for r in client.get("/imu").json()["items"]] == [300]
+    assert client.delete("/depth/purge", params={"before": 250}).status_code == 404
+
+
+def test_list_columnar_format(client) -> None:
+    """
+    @brief format=columnar sends column names once and rows as value arrays.
+    """
+    client.post("/depth", data={"DEPTH": 1.5, "TIMESTAMP": 42})
+
+    page = client.get("/depth", params={"format": "columnar"}).json()
+    assert page["columns"] == ["ID", "TIMESTAMP", "DEPTH"]
+    assert page["rows"] == [[1, 42, 1.5]]
+    assert (page["total"], page["limit"], page["offset"]) == (1, 50, 0)
+
+
+@pytest.mark.parametrize(
+    ("start", "end"),
+    [
+        ("1704067200000", "1704153600000"),
+        ("2024-01-01T00:00:00Z", "2024-01-02T00:00:00+00:00"),
+        ("2024-01-01T00:00:00", "2024-01-02T00:00:00"),  # naive = UTC
+    ],
+)
+def test_list_start_end_accepts_epoch_ms_and_iso(client, start, end) -> None:
+    """
+    @brief start/end filter on epoch ms whether given as integers or ISO-8601.
+    """
+    day_ms = 86_400_000
+    jan1 = 1_704_067_200_000  # 2024-01-01T00:00:00Z
+    for ts in (jan1 - 1, jan1, jan1 + day_ms // 2, jan1 + day_ms, jan1 + day_ms + 1):
+        client.post("/depth", data={"DEPTH": 1.0, "TIMESTAMP": ts})
+
+    page = client.get("/depth", params={"start": start, "end": end}).json()
+    assert sorted(r["TIMESTAMP"] for r in page["items"]) == [
+        jan1, jan1 + day_ms // 2, jan1 + day_ms,
+    ]
+
+
+@pytest.mark.parametrize("start", ["yesterday", "²", "١٢"])
+def test_list_rejects_bad_timestamp(client, start) -> None:
+    """
+    @brief An unparseable start (including non-ASCII digits) is a 422, not a 500.
+    """
+    assert client.get("/depth", params={"start": start}).status_code == 422
@@ -1,3 +1,5 @@
+import errno
+
 import pytest
 
 
@@ -8,3 +10,71 @@ def test_i2c_with_device() -> None:
     @details Runs only when -m hardware is used.
     """
     assert True
+
+
+class _FakeBus:
+    """
+    @brief Stand-in for smbus2.SMBus that fails i2c_rdwr with a queued errno.
+    """
+
+    def __init__(self, bus_number: int) -> None:
+        self.closed = False
+        self.fail_with: int | None = None
+
+    def i2c_rdwr(self, *msgs) -> None:
+        if self.fail_with is not None:
+            raise OSError(self.fail_with, "fake")
+
+    def close(self) -> None:
+        self.closed = True
+
+
+@pytest.fixture
+def opened() -> list[_FakeBus]:
+    """
+    @brief Every _FakeBus the module under test opened, in order.
+    """
+    return []
+
+
+@pytest.fixture
+def i2c(monkeypatch, opened):
+    from hardware_interface import i2c_commands
+
+    def open_bus(bus_number: int) -> _FakeBus:
+        opened.append(_FakeBus(bus_number))
+        return opened[-1]
+
+    monkeypatch.setattr(i2c_commands, "SMBus", open_bus)
+    monkeypatch.setattr(i2c_commands, "_buses", {})
+    return i2c_commands
+
+
+def test_i2c_device_error_keeps_shared_handle(i2c, opened) -> None:
+    """
+    @brief A device-level NACK must not close the handle other threads share.
+    """
+    i2c.write(1, 0x10, b"\x00")
+    bus = opened[0]
+    bus.fail_with = errno.EREMOTEIO
+    with pytest.raises(OSError, match="fake"):
+        i2c.write(1, 0x10, b"\x00")
+    assert not bus.closed
+    assert i2c._buses[1] is bus
+
+
+def test_i2c_adapter_error_reopens_handle(i2c, opened) -> None:
+    """
+    @brief ENODEV drops the handle and the next transfer opens a fresh one.
+    """
+    i2c.write(1, 0x10, b"\x00")
+    bus = opened[0]
+    bus.fail_with = errno.ENODEV
+    with pytest.raises(OSError, match="fake"):
+        i2c.write(1, 0x10, b"\x00")
+    assert bus.closed
+    assert 1 not in i2c._buses
+
+    i2c.write(1, 0x10, b"\x00")
+    assert len(opened) == 2
+    assert i2c._buses[1] is opened[1]
@@ -0,0 +1,50 @@
+import pytest
+from hardware_interface import pacing
+
+
+class _Clock:
+    """
+    @brief Fake monotonic clock; sleep() advances it instead of blocking.
+    """
+
+    def __init__(self) -> None:
+        self.now = 100.0
+        self.sleeps: list[float] = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def test_pacer_sleeps_only_the_remaining_slack(monkeypatch) -> None:
+    """
+    @brief Work done inside the loop body comes out of the period, not on top of it.
+    """
+    clock = _Clock()
+    monkeypatch.setattr(pacing, "time", clock)
+    pacer = pacing.Pacer(0.05)
+
+    clock.now += 0.02  # loop body
+    pacer.wait()
+    assert clock.sleeps == pytest.approx([0.03])
+    assert clock.now == pytest.approx(100.05)
+
+
+def test_pacer_resyncs_after_overrun(monkeypatch) -> None:
+    """
+    @brief An overrun resets the deadline instead of bursting catch-up ticks.
+    """
+    clock = _Clock()
+    monkeypatch.setattr(pacing, "time", clock)
+    pacer = pacing.Pacer(0.05)
+
+    clock.now += 0.2  # four periods late
+    pacer.wait()
+    assert clock.sleeps == []
+
+    clock.now += 0.01
+    pacer.wait()
+    assert clock.sleeps == pytest.approx([0.04])
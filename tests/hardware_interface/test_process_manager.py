@@ -0,0 +1,20 @@
+from libs.hardware_interface import process_manager
+
+
+def test_bad_address_marks_controller_unavailable(monkeypatch) -> None:
+    """
+    @brief A malformed *_ADDRESS must not break construction or status().
+    @details The bad controller reports disabled/undetected; the rest still parse.
+    """
+    monkeypatch.setenv("ESC_CONTROLLER", "True")
+    monkeypatch.setenv("ESC_ADDRESS", "not-hex")
+    monkeypatch.setenv("ARM_CONTROLLER", "True")
+    monkeypatch.setenv("ARM_ADDRESS", "0x2A")
+    monkeypatch.setattr(process_manager, "scan_i2c_bus", lambda bus: [0x2A])
+
+    hpm = process_manager.HardwareProcessManager(dry_run=True)
+    status = hpm.status()
+
+    assert status["esc"]["enabled"] is False
+    assert status["esc"]["detected"] is False
+    assert status["arm"] == {"enabled": True, "detected": True, "running": False, "tid": None}
@@ -0,0 +1,48 @@
+import threading
+
+import quick_request
+
+
+class _Resp:
+    ok = True
+
+
+class _Session:
+    """
+    @brief Stand-in for requests.Session that records POSTs instead of sending them.
+    """
+
+    def __init__(self) -> None:
+        self.posted: list[tuple[str, dict]] = []
+        self.release = threading.Event()
+
+    def post(self, url: str, data: dict, timeout: float) -> _Resp:
+        self.release.wait(1)
+        self.posted.append((url, data))
+        return _Resp()
+
+    def request(self, *args, **kwargs) -> _Resp:
+        raise AssertionError("unexpected synchronous request")
+
+    def close(self) -> None:
+        pass
+
+
+def test_close_flushes_queue_and_stops_writer(monkeypatch) -> None:
+    """
+    @brief close() sends rows still queued by post_nowait() and joins the writer.
+    """
+    session = _Session()
+    monkeypatch.setattr(quick_request.requests, "Session", lambda: session)
+
+    client = quick_request.AUVClient("http://db")
+    for depth in (1.0, 2.0, 3.0):
+        client.post_nowait("depth", DEPTH=depth)
+    writer = client._writer
+
+    session.release.set()
+    client.close()
+
+    assert not writer.is_alive()
+    assert [d["DEPTH"] for _, d in session.posted] == [1.0, 2.0, 3.0]
+    assert {url for url, _ in session.posted} == {"http://db/depth"}